@@ -0,0 +1,53 @@
+"""Numerical kernels for the hot paths of the Benders loop.
+
+Numba is an optional dependency; when it is not installed the plain
+NumPy implementations are used instead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _cut_values_numpy(intercepts: np.ndarray, coeffs: np.ndarray, x: np.ndarray):
+    return coeffs @ x + intercepts
+
+
+def _csr_matvec_sub_numpy(M, x: np.ndarray, out: np.ndarray):
+    out -= M @ x
+
+
+if njit is None:
+    cut_values = _cut_values_numpy
+
+    def csr_matvec_sub(M, x, out):
+        _csr_matvec_sub_numpy(M, x, out)
+
+else:
+
+    @njit(cache=True, fastmath=True)
+    def cut_values(intercepts, coeffs, x):  # pragma: no cover - compiled
+        n = coeffs.shape[0]
+        out = np.empty(n)
+        for i in range(n):
+            acc = intercepts[i]
+            row = coeffs[i]
+            for j in range(row.shape[0]):
+                acc += row[j] * x[j]
+            out[i] = acc
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def _csr_matvec_sub(data, indices, indptr, x, out):  # pragma: no cover
+        for i in range(out.shape[0]):
+            acc = 0.0
+            for k in range(indptr[i], indptr[i + 1]):
+                acc += data[k] * x[indices[k]]
+            out[i] -= acc
+
+    def csr_matvec_sub(M, x, out):
+        """In-place ``out -= M @ x`` for a CSR matrix, fused in one pass."""
+        _csr_matvec_sub(M.data, M.indices, M.indptr, x, out)
@@ -3,3 +3,18 @@ import logging
 consolelog = logging.getLogger("consolelog")
 consolelog.setLevel(level=logging.INFO)
 consolelog.propagate = False
+
+_configured = False
+
+
+def _configure_logging() -> None:
+    """Attach the console handler.  Deferred out of package import so
+    `import bendee` has no logging side effects; safe to call repeatedly."""
+    global _configured
+    if _configured:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))  # only show the message
+    consolelog.addHandler(handler)
+    logging.getLogger("gurobipy").propagate = False
+    _configured = True
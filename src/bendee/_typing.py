@@ -1,6 +1,7 @@
 from typing import Any, List, Protocol
 
 import gurobipy as gp
+import numpy as np
 
 from bendee.solution import Result
 from bendee.staging import SubproblemData
@@ -11,6 +12,14 @@ class MasterProblem(Protocol): ...
 
 
 class Subproblem(Protocol):
+    """Note: ``master_result.solution`` is a single read-only ndarray
+    shared by every subproblem; implementations should use the view
+    directly (e.g. in RHS updates) rather than copying it."""
+
+    # whether solve() consumes a precomputed A @ x product
+    uses_Ax: bool
+    data: SubproblemData
+
     def __init__(
         self,
         data: SubproblemData,
@@ -18,12 +27,21 @@ class Subproblem(Protocol):
         env: gp.Env,
         params: dict[str, Any] | None,
     ) -> None: ...
-    def solve(self, master_result: MasterResult) -> SubproblemResult: ...
+    def solve(
+        self, master_result: MasterResult, Ax: np.ndarray | None = None
+    ) -> SubproblemResult: ...
+    def solve_pareto(
+        self, master_result: MasterResult, core_point: np.ndarray
+    ) -> SubproblemResult | None: ...
     def close(self) -> None: ...
 
 
 class Framework(Protocol):
     def __init__(
-        self, master: MasterProblem, subproblems: List[Subproblem]
+        self,
+        master: MasterProblem,
+        subproblems: List[Subproblem],
+        parallel_subproblems: bool | None = None,
     ) -> None: ...
     def solve(self, *args, **kwargs) -> Result: ...
+    def close(self) -> None: ...
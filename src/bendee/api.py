@@ -1,7 +1,10 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import gurobipy as gp
 
-from bendee._logging import consolelog
-from bendee.config import Config
+from bendee._logging import _configure_logging, consolelog
+from bendee.config import Config, SubproblemLpForm
 from bendee.framework import get_framework_class
 from bendee.models import MasterProblem, get_subproblem_class
 from bendee.solution import Result
@@ -19,25 +22,59 @@ def solve(problem_spec: ProblemSpec, config: Config, env: gp.Env) -> Result:
         _description_
     """
 
+    _configure_logging()
+
+    if config.reset_subproblem and config.lp_form == SubproblemLpForm.primal:
+        # resetting discards the advanced basis between solves, defeating
+        # dual-simplex warm starts on the re-parameterized RHS
+        consolelog.warning("Forcing reset_subproblem=False for warm starts")
+        config.reset_subproblem = False
+
     data = problem_spec.make_problem_data()
 
     framework_class = get_framework_class(config.framework)
     subproblem_class = get_subproblem_class(config.lp_form, config.sub_return)
 
-    master = MasterProblem(
-        data.master, theta_lb=config.theta_lb, params=config.master_params
-    )
-    subproblems = [
-        subproblem_class(
+    # when subproblems are solved on Python threads, cap each Gurobi solve
+    # at one thread so workers do not oversubscribe the machine
+    parallel = config.parallel_subproblems
+    if parallel is None:
+        parallel = len(data.subproblems) > 1
+    if parallel and len(data.subproblems) > 1:
+        subproblem_params = {"Threads": 1, **config.subproblem_params}
+    else:
+        subproblem_params = config.subproblem_params
+
+    def make_subproblem(subproblem):
+        return subproblem_class(
             subproblem,
             config.reset_subproblem,
             env=env,
-            params=config.subproblem_params,
+            params=subproblem_params,
+        )
+
+    if len(data.subproblems) > 1:
+        # each constructor builds a Gurobi model, which releases the GIL,
+        # so master and subproblem construction can overlap
+        max_workers = min(len(data.subproblems) + 1, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            master_future = executor.submit(
+                MasterProblem,
+                data.master,
+                theta_lb=config.theta_lb,
+                params=config.master_params,
+            )
+            subproblems = list(executor.map(make_subproblem, data.subproblems))
+            master = master_future.result()
+    else:
+        master = MasterProblem(
+            data.master, theta_lb=config.theta_lb, params=config.master_params
         )
-        for subproblem in data.subproblems
-    ]
+        subproblems = [make_subproblem(subproblem) for subproblem in data.subproblems]
 
-    algo = framework_class(master, subproblems)
+    algo = framework_class(
+        master, subproblems, parallel_subproblems=config.parallel_subproblems
+    )
     result: Result = algo.solve(**config.get_solve_kwargs())
     result.resolve(problem_spec)
 
@@ -46,6 +83,7 @@ def solve(problem_spec: ProblemSpec, config: Config, env: gp.Env) -> Result:
     consolelog.info(f"{result.ObjBound=}")
     consolelog.info(f"{result.MIPGap=}")
 
+    algo.close()
     master.model.close()
     for subproblem in subproblems:
         subproblem.close()
@@ -4,6 +4,7 @@ from textwrap import dedent
 import click
 import gurobipy as gp
 
+from bendee._logging import _configure_logging
 from bendee.api import solve
 from bendee.config import Config, Framework, SubproblemLpForm, SubproblemReturn
 from bendee.solution import Result
@@ -16,6 +17,7 @@ logging.basicConfig(level=logging.ERROR)
 @click.version_option()
 def cli():
     "Command line interface for BenD ('bendee') package"
+    _configure_logging()
 
 
 @cli.command(name="config_example")
@@ -51,6 +53,12 @@ def print_config():
         # timelimit termination criteria (seconds) for iterative framework
         iterative_framework_timelimit = 100
 
+        # generate Pareto-optimal (Magnanti-Wong) cuts
+        pareto_cuts = false
+
+        # in-out stabilization weight on the master trial point (1.0 = off)
+        in_out_alpha = 1.0
+
                
         [env_params]
         WLSACCESSID = "1234abcd-1234-abcd-1234-abcd1234abcd"
@@ -1,9 +1,10 @@
 import tomllib
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import Any, Dict
 
 
-class Framework(Enum):
+# IntEnum so hot-path comparisons and dict lookups are plain int ops
+class Framework(IntEnum):
     callback = auto()
     iterative = auto()
 
@@ -12,7 +13,7 @@ class Framework(Enum):
         return Framework.callback
 
 
-class SubproblemLpForm(Enum):
+class SubproblemLpForm(IntEnum):
     primal = auto()
     dual = auto()
 
@@ -21,7 +22,7 @@ class SubproblemLpForm(Enum):
         return SubproblemLpForm.primal
 
 
-class SubproblemReturn(Enum):
+class SubproblemReturn(IntEnum):
     subgradient = auto()
     duals = auto()
 
@@ -30,41 +31,86 @@ class SubproblemReturn(Enum):
         return SubproblemReturn.subgradient
 
 
+_KNOWN_KEYS = frozenset(
+    (
+        "framework",
+        "lp_form",
+        "sub_return",
+        "reset_subproblem",
+        "parallel_subproblems",
+        "iterative_framework_params",
+        "env_params",
+        "master_params",
+        "subproblem_params",
+    )
+)
+
+
 class Config:
+    __slots__ = (
+        "framework",
+        "lp_form",
+        "sub_return",
+        "theta_lb",
+        "max_iterations",
+        "iterative_framework_optimality_gap",
+        "iterative_framework_timelimit",
+        "pareto_cuts",
+        "in_out_alpha",
+        "reset_subproblem",
+        "parallel_subproblems",
+        "env_params",
+        "master_params",
+        "subproblem_params",
+    )
+
     def __init__(self, toml_path: str | None = None) -> None:
         values = self._get_dict_from_toml(toml_path)
-        iterative_params = values.pop("iterative_framework_params", {})
-        self.framework: Framework = values.pop("framework", Framework.default())
-        self.lp_form: SubproblemLpForm = values.pop(
+        unknown = values.keys() - _KNOWN_KEYS
+        if unknown:
+            raise ValueError(f"Unknown config values: {', '.join(sorted(unknown))}")
+        iterative_params = values.get("iterative_framework_params", {})
+        self.framework: Framework = values.get("framework", Framework.default())
+        self.lp_form: SubproblemLpForm = values.get(
             "lp_form", SubproblemLpForm.default()
         )
-        self.sub_return: SubproblemReturn = values.pop(
+        self.sub_return: SubproblemReturn = values.get(
             "sub_return", SubproblemReturn.default()
         )
-        self.theta_lb = iterative_params.pop("theta_lb", -10000)
-        self.max_iterations: int = iterative_params.pop("max_iterations", 1000)
-        self.iterative_framework_optimality_gap: float = iterative_params.pop(
+        self.theta_lb = iterative_params.get("theta_lb", -10000)
+        self.max_iterations: int = iterative_params.get("max_iterations", 1000)
+        self.iterative_framework_optimality_gap: float = iterative_params.get(
             "iterative_framework_optimality_gap", 1e-8
         )
-        self.iterative_framework_timelimit: float = iterative_params.pop(
+        self.iterative_framework_timelimit: float = iterative_params.get(
             "iterative_framework_timelimit", float("inf")
         )
-        self.reset_subproblem: bool = values.pop("reset_subproblem", False)
-        self.env_params: dict[str, Any] = values.pop("env_params", {})
-        self.master_params: dict[str, Any] = values.pop("master_params", {})
-        self.subproblem_params: dict[str, Any] = values.pop("subproblem_params", {})
-
-        if values:
-            raise RuntimeError(f"Unknown config values: {', '.join(values.keys())}")
+        self.pareto_cuts: bool = iterative_params.get("pareto_cuts", False)
+        # in-out stabilization weight on the master trial point;
+        # 1.0 means no stabilization
+        self.in_out_alpha: float = iterative_params.get("in_out_alpha", 1.0)
+        self.reset_subproblem: bool = values.get("reset_subproblem", False)
+        # None means "decide at solve time": parallel when there is more
+        # than one subproblem
+        self.parallel_subproblems: bool | None = values.get(
+            "parallel_subproblems", None
+        )
+        self.env_params: dict[str, Any] = values.get("env_params", {})
+        self.master_params: dict[str, Any] = values.get("master_params", {})
+        self.subproblem_params: dict[str, Any] = values.get("subproblem_params", {})
 
     def get_solve_kwargs(self) -> Dict:
-        kwargs: dict[str, Any] = {}
+        # built at call time: attributes may be mutated after construction
+        # (e.g. by the CLI or tests), and solve is called once per run
         if self.framework == Framework.iterative:
-            kwargs["optimality_gap"] = self.iterative_framework_optimality_gap
-            kwargs["max_iterations"] = self.max_iterations
-            kwargs["timelimit"] = self.iterative_framework_timelimit
-
-        return kwargs
+            return {
+                "optimality_gap": self.iterative_framework_optimality_gap,
+                "max_iterations": self.max_iterations,
+                "timelimit": self.iterative_framework_timelimit,
+                "pareto_cuts": self.pareto_cuts,
+                "in_out_alpha": self.in_out_alpha,
+            }
+        return {}
 
     def _get_dict_from_toml(self, toml_path):
         if toml_path is None:
@@ -1,92 +1,366 @@
+import logging
+import os
 import time
-from typing import List, Type
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import List, Optional, Tuple, Type
 
 import gurobipy as gp
+import numpy as np
+import scipy.sparse as ss
 
 from bendee import config
+from bendee._kernels import cut_values
 from bendee._logging import consolelog
 from bendee._typing import Framework, Subproblem
 from bendee.config import _defaults as config_defaults
 from bendee.models import MasterProblem
 from bendee.solution import Result, SolutionStats
+from bendee.util import SubproblemResult
+
+# tolerance used when checking pooled cuts for violation
+_POOL_TOL = 1e-6
+
+# bound on the callback framework's seen-solution cache
+_SEEN_CACHE_MAX = 1024
+
+# above this many subproblems the generated straight-line solver would
+# bloat rather than help; fall back to the generic loop
+_UNROLL_MAX = 32
+
+
+def _make_unrolled_solver(
+    subproblems: List[Subproblem], early_exit_on_infeasible: bool = False
+):
+    """Generate a straight-line function solving each subproblem in turn.
+
+    The callback path runs thousands of times during branch and bound;
+    for a fixed, small number of subproblems, unrolling the loop at
+    construction time removes the list/iterator machinery and binds each
+    solve method directly.  With ``early_exit_on_infeasible`` the
+    generated code returns as soon as one feasibility cut is available.
+    """
+    n = len(subproblems)
+    lines = ["def _solve_all(master_result):"]
+    if early_exit_on_infeasible:
+        for i in range(n):
+            lines.append(f"    r{i} = _solve{i}(master_result)")
+            if i < n - 1:
+                results = ", ".join(f"r{j}" for j in range(i + 1))
+                lines.append(f"    if r{i}.infeasible:")
+                lines.append(f"        return [{results}]")
+        lines.append(f"    return [{', '.join(f'r{j}' for j in range(n))}]")
+    else:
+        lines.append("    return [")
+        lines += [f"        _solve{i}(master_result)," for i in range(n)]
+        lines.append("    ]")
+    namespace = {f"_solve{i}": subproblems[i].solve for i in range(n)}
+    exec(compile("\n".join(lines), "<bendee unrolled solver>", "exec"), namespace)
+    return namespace["_solve_all"]
 
 
 def get_framework_class(framework_value: config.Framework) -> Type[Framework]:
-    return {
-        config.Framework.callback: CallbackFramework,
-        config.Framework.iterative: IterativeFramework,
-    }[framework_value]
+    return _FRAMEWORK_MAP[framework_value]
+
+
+def _any_cut_violated(
+    subproblem_results: List[SubproblemResult],
+    master_result,
+    tol: float = _POOL_TOL,
+) -> bool:
+    """Whether any generated cut is violated at the master trial point."""
+    solution = master_result.solution
+    for i, result in enumerate(subproblem_results):
+        value = result.cutRHS.intercept + result.cutRHS.coeffs @ solution
+        threshold = 0.0 if result.infeasible else master_result.thetas[i]
+        if value > threshold + tol:
+            return True
+    return False
+
+
+def _make_subproblem_pool(
+    subproblems: List[Subproblem], parallel_subproblems: bool | None
+) -> Optional[ThreadPoolExecutor]:
+    # Gurobi releases the GIL during optimize(), so independent subproblem
+    # solves scale with threads.  Default to parallel when there is more
+    # than one subproblem.
+    if parallel_subproblems is None:
+        parallel_subproblems = len(subproblems) > 1
+    if not parallel_subproblems or len(subproblems) <= 1:
+        return None
+    return ThreadPoolExecutor(max_workers=min(len(subproblems), os.cpu_count() or 1))
+
+
+class DualSolutionPool:
+    """Pool of previously generated subproblem cuts.
+
+    A dual extreme point (or ray) found at an earlier master solution
+    stays feasible for the subproblem dual, so its cut can be re-checked
+    at any new master solution with a dot product instead of an LP solve.
+    """
+
+    def __init__(self) -> None:
+        self._results: List[SubproblemResult] = []
+        self._coeffs: np.ndarray = np.empty((0, 0))  # (capacity, n_vars)
+        self._intercepts: np.ndarray = np.empty(0)
+        self._infeasible: np.ndarray = np.empty(0, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def add(self, result: SubproblemResult) -> None:
+        coeffs = np.asarray(result.cutRHS.coeffs, dtype=float)
+        n = len(self._results)
+        if self._intercepts.shape[0] == 0:
+            capacity = 4
+            self._coeffs = np.empty((capacity, coeffs.shape[0]))
+            self._intercepts = np.empty(capacity)
+            self._infeasible = np.empty(capacity, dtype=bool)
+        elif n == self._intercepts.shape[0]:
+            # double capacity to amortize reallocation
+            self._coeffs = np.concatenate([self._coeffs, np.empty_like(self._coeffs)])
+            self._intercepts = np.concatenate(
+                [self._intercepts, np.empty_like(self._intercepts)]
+            )
+            self._infeasible = np.concatenate(
+                [self._infeasible, np.empty_like(self._infeasible)]
+            )
+        self._coeffs[n] = coeffs
+        self._intercepts[n] = result.cutRHS.intercept
+        self._infeasible[n] = result.infeasible
+        self._results.append(result)
+
+    def find_violated(
+        self, solution: np.ndarray, theta: float, tol: float = _POOL_TOL
+    ) -> SubproblemResult | None:
+        """Return a pooled result whose cut is violated at ``solution``.
+
+        Optimality cuts are violated when their value exceeds ``theta``;
+        feasibility cuts when their value exceeds zero.
+        """
+        n = len(self._results)
+        if n == 0:
+            return None
+        values = cut_values(
+            self._intercepts[:n],
+            self._coeffs[:n],
+            np.ascontiguousarray(solution, dtype=float),
+        )
+        violations = values - np.where(self._infeasible[:n], 0.0, theta)
+        best = int(np.argmax(violations))
+        if violations[best] > tol:
+            return self._results[best]
+        return None
 
 
 class IterativeFramework(Framework):
-    def __init__(self, master: MasterProblem, subproblems: List[Subproblem]) -> None:
+    def __init__(
+        self,
+        master: MasterProblem,
+        subproblems: List[Subproblem],
+        parallel_subproblems: bool | None = None,
+    ) -> None:
         self.master: MasterProblem = master
         self.subproblems: List[Subproblem] = subproblems
+        self._pool = _make_subproblem_pool(subproblems, parallel_subproblems)
+        self.dsp: dict[int, DualSolutionPool] = {
+            i: DualSolutionPool() for i in range(len(subproblems))
+        }
+        self.core_point: np.ndarray = master.get_core_point()
+        self.x_stab: np.ndarray | None = None
+        # preallocated per-iteration buffers
+        self._objvals: np.ndarray = np.empty(len(subproblems))
+        self._thetas: np.ndarray = np.empty(len(subproblems))
+        self._infeas: np.ndarray = np.zeros(len(subproblems), dtype=bool)
+        # when every subproblem consumes A @ x, stack the A blocks so one
+        # SpMV per iteration replaces a small product per subproblem
+        self._A_all: ss.csr_matrix | None = None
+        self._row_slices: List[slice] = []
+        if subproblems and all(sp.uses_Ax for sp in subproblems):
+            self._A_all = ss.vstack([sp.data.A for sp in subproblems], format="csr")
+            offsets = np.cumsum([0] + [sp.data.A.shape[0] for sp in subproblems])
+            self._row_slices = [
+                slice(offsets[i], offsets[i + 1]) for i in range(len(subproblems))
+            ]
+
+    def _solve_subproblems(self, master_result) -> Tuple[List, frozenset]:
+        """Solve all subproblems at the given master result.
+
+        Subproblems whose dual-solution pool already holds a violated cut
+        are skipped; the pooled result is reused instead of an LP solve.
+        Returns the results and the indices of reused (pooled) results.
+        """
+        solution = master_result.solution
+        results: List[SubproblemResult | None] = []
+        pending: List[Tuple[int, Subproblem]] = []
+        for i, subproblem in enumerate(self.subproblems):
+            cached = self.dsp[i].find_violated(solution, master_result.thetas[i])
+            results.append(cached)
+            if cached is None:
+                pending.append((i, subproblem))
+        Ax_all = None
+        if pending and self._A_all is not None:
+            Ax_all = self._A_all @ solution
+
+        def solve_one(pair):
+            i, subproblem = pair
+            Ax = Ax_all[self._row_slices[i]] if Ax_all is not None else None
+            return subproblem.solve(master_result, Ax=Ax)
+
+        if self._pool is None or len(pending) <= 1:
+            solved = [solve_one(pair) for pair in pending]
+        else:
+            solved = list(self._pool.map(solve_one, pending))
+        for (i, _), result in zip(pending, solved):
+            self.dsp[i].add(result)
+            results[i] = result
+        pooled = frozenset(range(len(self.subproblems))) - frozenset(
+            i for i, _ in pending
+        )
+        return results, pooled
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
 
     def solve(
         self,
         optimality_gap: float = config_defaults.iterative_framework_optimality_gap,
         timelimit: float = config_defaults.iterative_framework_timelimit,
         max_iterations: int = config_defaults.max_iterations,
+        pareto_cuts: bool = config_defaults.pareto_cuts,
+        in_out_alpha: float = config_defaults.in_out_alpha,
     ) -> Result:
         COLWIDTH = 20
-        start_time = time.time()
+        # integer nanosecond deadline: one clock read and one integer
+        # comparison per iteration
+        start_ns = time.monotonic_ns()
+        if timelimit == float("inf"):
+            deadline_ns = 2**63 - 1
+        else:
+            deadline_ns = start_ns + int(timelimit * 1e9)
         upper_bound = float("inf")
+        solution_stats: SolutionStats | None = None
+        master = self.master  # hoist hot attribute lookups out of the loop
 
-        consolelog.info(
-            f"{'Iteration':>{COLWIDTH}} {'Lower Bound':>{COLWIDTH}} {'Upper Bound':>{COLWIDTH}} {'Gap':>{COLWIDTH}}"
-        )
+        # precompute formats and gate emissions so no per-iteration
+        # strings are built when INFO is disabled
+        log_info = consolelog.isEnabledFor(logging.INFO)
+        row_format = f"%{COLWIDTH}s %{COLWIDTH}.6f %{COLWIDTH}.6f %{COLWIDTH}s"
+        dash_row_format = f"%{COLWIDTH}s %{COLWIDTH}s %{COLWIDTH}s %{COLWIDTH}s"
+        if log_info:
+            consolelog.info(
+                f"{'Iteration':>{COLWIDTH}} {'Lower Bound':>{COLWIDTH}} {'Upper Bound':>{COLWIDTH}} {'Gap':>{COLWIDTH}}"
+            )
         for k in range(max_iterations):
-            master_result = self.master.optimize()
+            master_result = master.optimize()
+            # every subproblem shares this array; mark it read-only so
+            # solves can use the view directly instead of copying
+            master_result.solution.setflags(write=False)
             lower_bound = master_result.objval
-            subproblem_results = [
-                subproblem.solve(master_result) for subproblem in self.subproblems
-            ]
-            if all(not result.infeasible for result in subproblem_results):
-                upper_bound = min(
-                    master_result.objval
-                    + sum(
-                        result.objval_sub - theta
-                        for result, theta in zip(
-                            subproblem_results, master_result.thetas
-                        )
-                    ),
-                    upper_bound,
+            if in_out_alpha < 1.0 and self.x_stab is not None:
+                # in-out stabilization: separate at a point between the
+                # master trial point and the best incumbent
+                sep_point = (
+                    in_out_alpha * master_result.solution
+                    + (1.0 - in_out_alpha) * self.x_stab
                 )
+                sep_point.setflags(write=False)
+                sep_result = replace(master_result, solution=sep_point)
+            else:
+                sep_result = master_result
+            subproblem_results, pooled = self._solve_subproblems(sep_result)
+            if sep_result is not master_result and not _any_cut_violated(
+                subproblem_results, master_result
+            ):
+                # cuts from the separation point do not cut off the master
+                # trial point; fall back to separating at the trial point
+                # so the iteration makes progress
+                sep_result = master_result
+                subproblem_results, pooled = self._solve_subproblems(master_result)
+            for i, result in enumerate(subproblem_results):
+                self._objvals[i] = result.objval_sub
+                self._infeas[i] = result.infeasible
+            self._thetas[:] = master_result.thetas
+            # pooled results carry objectives from an earlier master
+            # solution, and stabilized separation evaluates the subproblems
+            # at a point other than the trial one, so bound updates are
+            # only valid on full solves at the master trial point
+            if sep_result is master_result and not pooled and not self._infeas.any():
+                candidate_upper_bound = master_result.objval + float(
+                    (self._objvals - self._thetas).sum()
+                )
+                if candidate_upper_bound < upper_bound:
+                    upper_bound = candidate_upper_bound
+                    self.x_stab = master_result.solution
                 if upper_bound == 0:
                     gap = float("inf")
                 else:
                     gap = abs((upper_bound - lower_bound) / upper_bound)
-                consolelog.info(
-                    f"{f'iter {k}':>{COLWIDTH}} {lower_bound:>{COLWIDTH}.6f} {upper_bound:>{COLWIDTH}.6f} {f'{gap * 100:.2f}%':>{COLWIDTH}}"
-                )
-                current_runtime = time.time() - start_time
-                if (gap < optimality_gap) or (current_runtime > timelimit):
+                if log_info:
+                    consolelog.info(
+                        row_format,
+                        f"iter {k}",
+                        lower_bound,
+                        upper_bound,
+                        f"{gap * 100:.2f}%",
+                    )
+                now_ns = time.monotonic_ns()
+                if (gap < optimality_gap) or (now_ns > deadline_ns):
                     solution_stats = SolutionStats(
-                        Runtime=current_runtime,
+                        Runtime=(now_ns - start_ns) / 1e9,
                         ObjVal=upper_bound,
                         ObjBound=lower_bound,
                         MIPGap=gap,
                     )
-                    if current_runtime > timelimit:
+                    if now_ns > deadline_ns:
                         termination_message = "Reached timelimit"
                     else:
                         termination_message = "Achieved optimality gap"
                     consolelog.info(
-                        f"Terminating.  {termination_message}. Objective value: {upper_bound}"
+                        "Terminating.  %s. Objective value: %s",
+                        termination_message,
+                        upper_bound,
                     )
                     break
             else:
-                consolelog.info(
-                    f"{f'iter {k}':>{COLWIDTH}} {'----':>{COLWIDTH}} {'----':>{COLWIDTH}} {'----':>{COLWIDTH}}"
-                )
-            for result in subproblem_results:
-                self.master.add_constraint(
+                if log_info:
+                    consolelog.info(
+                        dash_row_format, f"iter {k}", "----", "----", "----"
+                    )
+            for i, result in enumerate(subproblem_results):
+                cut_result = result
+                if pareto_cuts and not result.infeasible and i not in pooled:
+                    refined = self.subproblems[i].solve_pareto(
+                        sep_result, self.core_point
+                    )
+                    if refined is not None and not refined.infeasible:
+                        cut_result = refined
+                master.add_constraint(
                     lazy=False,
                     infeasible=result.infeasible,
-                    cutRHS=result.cutRHS,
+                    cutRHS=cut_result.cutRHS,
                     subproblem_num=result.subproblem_num,
                 )
+        if solution_stats is None:
+            # loop exhausted max_iterations without meeting a
+            # termination criterion
+            if upper_bound == 0:
+                gap = float("inf")
+            else:
+                gap = abs((upper_bound - lower_bound) / upper_bound)
+            solution_stats = SolutionStats(
+                Runtime=(time.monotonic_ns() - start_ns) / 1e9,
+                ObjVal=upper_bound,
+                ObjBound=lower_bound,
+                MIPGap=gap,
+            )
+            consolelog.info(
+                "Terminating.  %s. Objective value: %s",
+                "Reached iteration limit",
+                upper_bound,
+            )
         return Result(
             master_result=master_result,
             subproblem_results=subproblem_results,
@@ -95,34 +369,84 @@ class IterativeFramework(Framework):
 
 
 class CallbackFramework(Framework):
-    def __init__(self, master: MasterProblem, subproblems: List[Subproblem]) -> None:
+    def __init__(
+        self,
+        master: MasterProblem,
+        subproblems: List[Subproblem],
+        parallel_subproblems: bool | None = None,
+    ) -> None:
         self.master: MasterProblem = master
         self.subproblems: List[Subproblem] = subproblems
         self.master.set_params_for_callback()
         self.best_obj = float("inf")
+        self._pool = _make_subproblem_pool(subproblems, parallel_subproblems)
+        # Gurobi can re-trigger MIPSOL on an already-visited solution;
+        # cache results so those callbacks skip the subproblem solves
+        self._seen: OrderedDict[bytes, List[SubproblemResult]] = OrderedDict()
+        # one feasibility cut per callback is enough to reject an
+        # incumbent; skip the remaining solves when one is found
+        self.early_exit_on_infeasible = True
+        self._solve_serial = (
+            _make_unrolled_solver(
+                subproblems, early_exit_on_infeasible=self.early_exit_on_infeasible
+            )
+            if len(subproblems) <= _UNROLL_MAX
+            else None
+        )
+
+    def _solve_subproblems(self, master_result, early_exit: bool = True) -> List:
+        if self._pool is None:
+            if early_exit and self._solve_serial is not None:
+                return self._solve_serial(master_result)
+            results = []
+            for subproblem in self.subproblems:
+                result = subproblem.solve(master_result)
+                results.append(result)
+                if early_exit and self.early_exit_on_infeasible and result.infeasible:
+                    break
+            return results
+        # the parallel path submits everything up front, so there is no
+        # early exit to take
+        return list(
+            self._pool.map(lambda sp: sp.solve(master_result), self.subproblems)
+        )
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
 
     def __call__(self, _, where):
         if where == gp.GRB.Callback.MIPSOL:
             master_result = self.master.get_callback_result()
-            subproblem_results = [
-                subproblem.solve(master_result) for subproblem in self.subproblems
-            ]
-            for result in subproblem_results:
-                self.master.add_constraint(
-                    lazy=True,
-                    infeasible=result.infeasible,
-                    cutRHS=result.cutRHS,
-                    subproblem_num=result.subproblem_num,
-                )
+            master_result.solution.setflags(write=False)
+            key = np.ascontiguousarray(master_result.solution).tobytes()
+            subproblem_results = self._seen.get(key)
+            if subproblem_results is None:
+                subproblem_results = self._solve_subproblems(master_result)
+                self._seen[key] = subproblem_results
+                if len(self._seen) > _SEEN_CACHE_MAX:
+                    self._seen.popitem(last=False)
+            self.master.add_constraints_batch(
+                [
+                    (result.infeasible, result.cutRHS, result.subproblem_num)
+                    for result in subproblem_results
+                ]
+            )
 
     def solve(self) -> Result:
         self.master.ensure_mip()
         master_result = self.master.optimize(self)
-        subproblem_results = [
-            subproblem.solve(master_result) for subproblem in self.subproblems
-        ]
+        # this final solve populates Result.resolve, which needs one
+        # result per subproblem; never truncate it
+        subproblem_results = self._solve_subproblems(master_result, early_exit=False)
         return Result(
             master_result=master_result,
             subproblem_results=subproblem_results,
             solution_stats=self.master.get_solution_stats(),
         )
+
+
+_FRAMEWORK_MAP: dict[config.Framework, Type[Framework]] = {
+    config.Framework.callback: CallbackFramework,
+    config.Framework.iterative: IterativeFramework,
+}
@@ -1,8 +1,10 @@
 import logging
+from dataclasses import replace
 from typing import Any, Callable, List, Tuple, Type
 
 import gurobipy as gp
 import numpy as np
+import scipy.sparse as ss
 
 from bendee._typing import MasterProblem as MasterproblemProtocol
 from bendee._typing import Subproblem
@@ -11,16 +13,15 @@ from bendee.config import SubproblemReturn as SubReturn
 from bendee.config import _defaults as config_defaults
 from bendee.solution import SolutionStats
 from bendee.staging import MasterData, SubproblemData
-from bendee.util import CutRHS, MasterResult, SubproblemResult
+from bendee.util import CutRHS, CutTuple, MasterResult, SubproblemResult
+
+# resolved once at import; ConcurrentMethod replaced Method=5 in Gurobi 11
+_GUROBI_MAJOR = gp.gurobi.version()[0]
+_DEFAULT_LP_METHOD = {"ConcurrentMethod": 3} if _GUROBI_MAJOR >= 11 else {"Method": 5}
 
 
 def get_subproblem_class(lp_form: SubForm, sub_return: SubReturn) -> Type[Subproblem]:
-    return {
-        (SubForm.primal, SubReturn.duals): PrimalParamX,
-        (SubForm.primal, SubReturn.subgradient): PrimalVariableX,
-        (SubForm.dual, SubReturn.duals): DualParamX,
-        (SubForm.dual, SubReturn.subgradient): DualVariableX,
-    }[(lp_form, sub_return)]
+    return _SUBPROBLEM_CLASS_MAP[(lp_form, sub_return)]
 
 
 class MasterProblem(MasterproblemProtocol):
@@ -31,7 +32,6 @@ class MasterProblem(MasterproblemProtocol):
         params: dict[str, Any] | None = None,
     ) -> None:
         self.model: gp.Model = data.model.copy()
-        self._dummy_binary_added = False
         self._is_continuous_model = data.is_continuous_model
 
         default_params = {"OutputFlag": 0}
@@ -51,24 +51,33 @@ class MasterProblem(MasterproblemProtocol):
 
     def ensure_mip(self) -> None:
         if self._is_continuous_model:
-            self._dummy_binary_added = True
             self.model.addVar(vtype="B", name="dummy_mip")
 
     def optimize(self, callback: Callable | None = None) -> MasterResult:
         self.model.optimize(callback)
-        solution = self.vars.getAttr("X")
-        if self._dummy_binary_added:
-            solution = solution[:-1]
+        # self.vars was built before the thetas (and any dummy binary)
+        # were added, so a single attribute fetch yields exactly the
+        # master solution
         master_result = MasterResult(
             objval=self.model.ObjVal,
             thetas=[theta.X for theta in self.thetas],
             solution=self.vars.getAttr("X"),
         )
         logging.debug(f"master: objective {master_result.objval}")
-        logging.debug(f"master: thetas {[theta.X for theta in self.thetas]}")
+        logging.debug(f"master: thetas {master_result.thetas}")
         logging.debug(f"master: solution {master_result.solution}")
         return master_result
 
+    def get_core_point(self) -> np.ndarray:
+        """Midpoint of the master variable bounds, used as the core point
+        for Pareto-optimal (Magnanti-Wong) cut generation."""
+        lb = np.array(self.vars.getAttr("LB"))
+        ub = np.array(self.vars.getAttr("UB"))
+        # fall back to a unit box around the finite bound when unbounded
+        lb = np.where(np.isfinite(lb), lb, np.where(np.isfinite(ub), ub - 1.0, 0.0))
+        ub = np.where(np.isfinite(ub), ub, lb + 1.0)
+        return 0.5 * (lb + ub)
+
     def get_solution_stats(self):
         return SolutionStats(
             self.model.Runtime,
@@ -102,8 +111,21 @@ class MasterProblem(MasterproblemProtocol):
         else:
             self.model.addConstr(expr)
 
+    def add_constraints_batch(self, cuts: List[CutTuple]) -> None:
+        """Submit a batch of lazy cuts from a callback, hoisting attribute
+        lookups so each cut costs a single cbLazy call."""
+        cb_lazy = self.model.cbLazy
+        thetas = self.thetas
+        vars = self.vars
+        for infeasible, cutRHS, subproblem_num in cuts:
+            LHS = 0 if infeasible else thetas[subproblem_num]
+            cb_lazy(LHS >= cutRHS.intercept + cutRHS.coeffs @ vars)
+
 
 class PrimalParamX(Subproblem):
+    # solve() accepts a precomputed A @ x product (see IterativeFramework)
+    uses_Ax = True
+
     def __init__(
         self,
         data: SubproblemData,
@@ -114,21 +136,24 @@ class PrimalParamX(Subproblem):
         self.reset_subproblem: bool = reset_subproblem
         data.transform(translate_lb=True, ub_constraints=True)
         self.data: SubproblemData = data
+        # stack b on top of -A^T: one SpMV then yields [intercept, coeffs]
+        self._bA = ss.vstack(
+            [ss.csr_matrix(data.b.reshape(1, -1)), -data.A.T], format="csr"
+        )
+        # reusable RHS buffer; avoids allocating b - Ax every solve
+        self._rhs_buf = np.empty_like(data.b)
         self.env = env
         self.y, self.constrs, self.model = self._make_subproblem(data)
         self._set_params(params)
+        # memo of the last solve, keyed on the master solution bytes
+        self._last_sol_key: bytes | None = None
+        self._last_result: SubproblemResult | None = None
 
     def close(self):
         self.model.close()
 
     def _set_params(self, params: dict[str, Any] | None):
-        default_params = {"OutputFlag": 0, "InfUnbdInfo": 1}
-        major = gp.gurobi.version()[0]
-        if major >= 11:
-            default_params["ConcurrentMethod"] = 3
-        else:
-            default_params["Method"] = 5
-
+        default_params = {"OutputFlag": 0, "InfUnbdInfo": 1, **_DEFAULT_LP_METHOD}
         params = {**default_params, **params} if params else default_params
         for param, val in params.items():
             self.model.setParam(param, val)
@@ -144,13 +169,20 @@ class PrimalParamX(Subproblem):
         y = subproblem.addMVar(data.num_continuous_vars)
         constrs = subproblem.addConstr(data.B @ y >= 0)
         subproblem.setObjective(data.c @ y + data.c_const)
-        subproblem.update()  # needed?
         return y, constrs, subproblem
 
-    def solve(self, master_result: MasterResult) -> SubproblemResult:
+    def solve(
+        self, master_result: MasterResult, Ax: np.ndarray | None = None
+    ) -> SubproblemResult:
+        sol_key = master_result.solution.tobytes()
+        if sol_key == self._last_sol_key and self._last_result is not None:
+            return self._last_result
         if self.reset_subproblem:
-            self.model.reset_subproblem()
-        self.constrs.RHS = self.data.b - self.data.A @ master_result.solution
+            self.model.reset()
+        if Ax is None:
+            Ax = self.data.A @ master_result.solution
+        np.subtract(self.data.b, Ax, out=self._rhs_buf)
+        self.constrs.setAttr("RHS", self._rhs_buf)
         self.model.optimize()
         infeasible = self.model.Status in (
             gp.GRB.Status.INF_OR_UNBD,
@@ -160,10 +192,8 @@ class PrimalParamX(Subproblem):
             duals = -np.array(self.model.farkasdual)
         else:
             duals = np.array(self.constrs.Pi).flatten()
-        cutRHS = CutRHS(
-            intercept=self.data.b @ duals,
-            coeffs=-(duals @ self.data.A),
-        )
+        out = self._bA @ duals
+        cutRHS = CutRHS(intercept=out[0], coeffs=out[1:])
         result = SubproblemResult(
             infeasible=infeasible,
             objval_sub=self.model.ObjVal,
@@ -175,10 +205,23 @@ class PrimalParamX(Subproblem):
         logging.debug(f"sub: infeasible = {result.infeasible}")
         logging.debug(f"sub: obj_sub = {result.objval_sub}")
         logging.debug(f"sub: cutRHS = {result.cutRHS}")
+        self._last_sol_key = sol_key
+        self._last_result = result
         return result
 
+    def solve_pareto(
+        self, master_result: MasterResult, core_point: np.ndarray
+    ) -> SubproblemResult | None:
+        """Pareto cut via the Papadakos variant: duals are not decision
+        variables in the primal form, so re-solve at the core point and
+        use the resulting (Pareto-optimal) dual extreme point."""
+        result = self.solve(replace(master_result, solution=core_point))
+        return None if result.infeasible else result
+
 
 class PrimalVariableX(Subproblem):
+    uses_Ax = False
+
     def __init__(
         self,
         data: SubproblemData,
@@ -191,8 +234,11 @@ class PrimalVariableX(Subproblem):
         self.data = data  # no need to transform subproblem data, we can use bounds
         self.subproblem_num = data.subproblem_num
         self.zero_obj = data.zero_obj
-        self.x, self.y, self.model = self._make_subproblem(data)
+        self.x, self.y, self.fix_cons, self.model = self._make_subproblem(data)
         self._set_params(params)
+        # memo of the last solve, keyed on the master solution bytes
+        self._last_sol_key: bytes | None = None
+        self._last_result: SubproblemResult | None = None
 
     def close(self):
         self.model.close()
@@ -207,13 +253,17 @@ class PrimalVariableX(Subproblem):
 
     def _make_subproblem(
         self, data: SubproblemData
-    ) -> Tuple[gp.MVar, gp.MVar, gp.Model]:
+    ) -> Tuple[gp.MVar, gp.MVar, gp.MConstr, gp.Model]:
         if self.env is None:
             subproblem = gp.Model()
         else:
             subproblem = gp.Model(name="SUB", env=self.env)
-        x = subproblem.addMVar(data.num_integer_vars)
+        # x is fixed per solve via the RHS of fix_cons (one attribute set
+        # per iteration, versus writing both bound vectors); its duals
+        # provide the subgradient the reduced costs used to
+        x = subproblem.addMVar(data.num_integer_vars, lb=-float("inf"))
         y = subproblem.addMVar(data.num_continuous_vars, lb=data.lb, ub=data.ub)
+        fix_cons = subproblem.addConstr(x == 0)
         if data.zero_obj:
             s = subproblem.addMVar(len(data.b))
             subproblem.addConstr(data.A @ x + data.B @ y + s.sum() >= data.b)
@@ -221,7 +271,7 @@ class PrimalVariableX(Subproblem):
         else:
             subproblem.addConstr(data.A @ x + data.B @ y >= data.b)
             subproblem.setObjective(data.c @ y + data.c_const)
-        return x, y, subproblem
+        return x, y, fix_cons, subproblem
 
     def _is_infeasible(self):
         if self.zero_obj:
@@ -233,14 +283,18 @@ class PrimalVariableX(Subproblem):
             )
         return infeasible
 
-    def solve(self, master_result: MasterResult) -> SubproblemResult:
+    def solve(
+        self, master_result: MasterResult, Ax: np.ndarray | None = None
+    ) -> SubproblemResult:
+        sol_key = master_result.solution.tobytes()
+        if sol_key == self._last_sol_key and self._last_result is not None:
+            return self._last_result
         if self.reset_subproblem:
             self.model.reset()
-        self.x.setAttr("LB", master_result.solution)
-        self.x.setAttr("UB", master_result.solution)
+        self.fix_cons.setAttr("RHS", master_result.solution)
         self.model.optimize()
         infeasible = self._is_infeasible()
-        subgradient = np.array(self.x.RC)
+        subgradient = np.array(self.fix_cons.Pi)
         logging.debug(f"sub: subgradient = {subgradient}")
         cutRHS = CutRHS(
             intercept=self.model.ObjVal - master_result.solution @ subgradient,
@@ -257,10 +311,22 @@ class PrimalVariableX(Subproblem):
         )
         logging.debug(f"sub: obj_sub = {result.objval_sub}")
         logging.debug(f"sub: cutRHS = {result.cutRHS}")
+        self._last_sol_key = sol_key
+        self._last_result = result
         return result
 
+    def solve_pareto(
+        self, master_result: MasterResult, core_point: np.ndarray
+    ) -> SubproblemResult | None:
+        # subgradient cuts are taken at the trial point; no dual extreme
+        # point to refine
+        return None
+
 
 class DualParamX(Subproblem):
+    # solve() accepts a precomputed A @ x product (see IterativeFramework)
+    uses_Ax = True
+
     def __init__(
         self,
         data: SubproblemData,
@@ -272,20 +338,21 @@ class DualParamX(Subproblem):
         self.env = env
         data.transform(translate_lb=True, ub_constraints=True)
         self.data = data
+        # stack b on top of -A^T: one SpMV then yields [intercept, coeffs]
+        self._bA = ss.vstack(
+            [ss.csr_matrix(data.b.reshape(1, -1)), -data.A.T], format="csr"
+        )
         self.y, self.dual_cons, self.model = self._make_subproblem(data)
         self._set_params(params)
+        # memo of the last solve, keyed on the master solution bytes
+        self._last_sol_key: bytes | None = None
+        self._last_result: SubproblemResult | None = None
 
     def close(self):
         self.model.close()
 
     def _set_params(self, params: dict[str, Any] | None):
-        default_params = {"OutputFlag": 0, "InfUnbdInfo": 1}
-        major = gp.gurobi.version()[0]
-        if major >= 11:
-            default_params["ConcurrentMethod"] = 3
-        else:
-            default_params["Method"] = 5
-
+        default_params = {"OutputFlag": 0, "InfUnbdInfo": 1, **_DEFAULT_LP_METHOD}
         params = {**default_params, **params} if params else default_params
         for param, val in params.items():
             self.model.setParam(param, val)
@@ -300,13 +367,19 @@ class DualParamX(Subproblem):
         y = subproblem.addMVar(len(data.b))
         dual_cons = subproblem.addConstr(y @ data.B <= data.c)
         subproblem.setObjective(data.c_const, gp.GRB.MAXIMIZE)
-        subproblem.update()  # needed?
         return y, dual_cons, subproblem
 
-    def solve(self, master_result: MasterResult) -> SubproblemResult:
+    def solve(
+        self, master_result: MasterResult, Ax: np.ndarray | None = None
+    ) -> SubproblemResult:
+        sol_key = master_result.solution.tobytes()
+        if sol_key == self._last_sol_key and self._last_result is not None:
+            return self._last_result
         if self.reset_subproblem:
             self.model.reset()
-        self.y.Obj = self.data.b - self.data.A @ master_result.solution
+        if Ax is None:
+            Ax = self.data.A @ master_result.solution
+        self.y.Obj = self.data.b - Ax
         self.model.optimize()
         unbounded = self.model.Status in (
             gp.GRB.Status.INF_OR_UNBD,
@@ -316,10 +389,8 @@ class DualParamX(Subproblem):
             duals = np.array(self.model.UnbdRay)
         else:
             duals = np.array(self.y.X).flatten()
-        cutRHS = CutRHS(
-            intercept=self.data.b @ duals,
-            coeffs=-duals @ self.data.A,
-        )
+        out = self._bA @ duals
+        cutRHS = CutRHS(intercept=out[0], coeffs=out[1:])
         result = SubproblemResult(
             infeasible=unbounded,
             objval_sub=self.model.ObjVal,
@@ -331,8 +402,38 @@ class DualParamX(Subproblem):
         logging.debug(f"sub: infeasible = {result.infeasible}")
         logging.debug(f"sub: obj_sub = {result.objval_sub}")
         logging.debug(f"sub: cutRHS = {result.cutRHS}")
+        self._last_sol_key = sol_key
+        self._last_result = result
         return result
 
+    def solve_pareto(
+        self, master_result: MasterResult, core_point: np.ndarray
+    ) -> SubproblemResult | None:
+        """Magnanti-Wong refinement: fix the dual objective at its optimum
+        and re-optimize towards the core point, yielding a Pareto-optimal
+        dual solution for the cut."""
+        objval = self.model.ObjVal
+        current_obj = np.array(self.y.Obj)
+        fix = self.model.addConstr(current_obj @ self.y == objval)
+        try:
+            self.y.Obj = self.data.b - self.data.A @ core_point
+            self.model.optimize()
+            if self.model.Status != gp.GRB.Status.OPTIMAL:
+                return None
+            duals = np.array(self.y.X).flatten()
+            out = self._bA @ duals
+            cutRHS = CutRHS(intercept=out[0], coeffs=out[1:])
+            return SubproblemResult(
+                infeasible=False,
+                objval_sub=objval,
+                cutRHS=cutRHS,
+                subproblem_num=self.data.subproblem_num,
+                solution=self.dual_cons.getAttr("Pi"),
+                solution_offset=self.data.lb if self.data.offset else None,
+            )
+        finally:
+            self.model.remove(fix)
+
 
 class DualVariableX(Subproblem):
     """_summary_
@@ -343,6 +444,8 @@ class DualVariableX(Subproblem):
         _description_
     """
 
+    uses_Ax = False
+
     # min du + vx'
     # uA + v <= 0
     # uB <= c
@@ -362,18 +465,15 @@ class DualVariableX(Subproblem):
         self.zero_obj = data.zero_obj
         self.u, self.dual_cons, self.model = self._make_subproblem(data)
         self._set_params(params)
+        # memo of the last solve, keyed on the master solution bytes
+        self._last_sol_key: bytes | None = None
+        self._last_result: SubproblemResult | None = None
 
     def close(self):
         self.model.close()
 
     def _set_params(self, params: dict[str, Any] | None):
-        default_params = {"OutputFlag": 0, "InfUnbdInfo": 1}
-        major = gp.gurobi.version()[0]
-        if major >= 11:
-            default_params["ConcurrentMethod"] = 3
-        else:
-            default_params["Method"] = 5
-
+        default_params = {"OutputFlag": 0, "InfUnbdInfo": 1, **_DEFAULT_LP_METHOD}
         params = {**default_params, **params} if params else default_params
         for param, val in params.items():
             self.model.setParam(param, val)
@@ -391,10 +491,14 @@ class DualVariableX(Subproblem):
         dual_cons = subproblem.addConstr(y @ data.B <= data.c)
         subproblem.addConstr(y @ data.A + u <= 0)
         subproblem.setObjective(data.b @ y + data.c_const, gp.GRB.MAXIMIZE)
-        subproblem.update()  # needed?
         return u, dual_cons, subproblem
 
-    def solve(self, master_result: MasterResult) -> SubproblemResult:
+    def solve(
+        self, master_result: MasterResult, Ax: np.ndarray | None = None
+    ) -> SubproblemResult:
+        sol_key = master_result.solution.tobytes()
+        if sol_key == self._last_sol_key and self._last_result is not None:
+            return self._last_result
         if self.reset_subproblem:
             self.model.reset()
         self.u.setAttr("Obj", master_result.solution)
@@ -429,4 +533,21 @@ class DualVariableX(Subproblem):
         )
         logging.debug(f"sub: obj_sub = {result.objval_sub}")
         logging.debug(f"sub: cutRHS = {result.cutRHS}")
+        self._last_sol_key = sol_key
+        self._last_result = result
         return result
+
+    def solve_pareto(
+        self, master_result: MasterResult, core_point: np.ndarray
+    ) -> SubproblemResult | None:
+        # subgradient cuts are taken at the trial point; no dual extreme
+        # point to refine
+        return None
+
+
+_SUBPROBLEM_CLASS_MAP: dict[Tuple[SubForm, SubReturn], Type[Subproblem]] = {
+    (SubForm.primal, SubReturn.duals): PrimalParamX,
+    (SubForm.primal, SubReturn.subgradient): PrimalVariableX,
+    (SubForm.dual, SubReturn.duals): DualParamX,
+    (SubForm.dual, SubReturn.subgradient): DualVariableX,
+}
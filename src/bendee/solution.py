@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-from itertools import chain
 from typing import List
 
 import numpy as np
@@ -31,25 +30,15 @@ class Result:
         self._varname: List[str] | None = None
 
     def resolve(self, problem_spec: ProblemSpec):
-        var_inds = list(
-            chain(
-                problem_spec.complicating_vars,
-                *problem_spec.non_complicating_vars,
-            )
-        )
-
-        var_values = np.array(
-            list(
-                chain(
-                    self._master_result.solution,
-                    *[
-                        subproblem_result.X
-                        for subproblem_result in self._subproblem_results
-                    ],
-                )
-            )
-        )
-        self._X = var_values[np.argsort(var_inds)]
+        # scatter each block straight into place; the argsort it replaces
+        # only ever computed an inverse permutation
+        X = np.empty(problem_spec._model.NumVars)
+        X[problem_spec.complicating_vars] = self._master_result.solution
+        for var_inds, subproblem_result in zip(
+            problem_spec.non_complicating_vars, self._subproblem_results
+        ):
+            X[var_inds] = subproblem_result.X
+        self._X = X
         self._vtype = problem_spec._model.VType
         self._varname = problem_spec._model.VarName
 
@@ -85,7 +74,11 @@ class Result:
                 f"File has extension .{ext} but must extension .sol or .mst"
             )
         include = " ".__ne__ if ext == "sol" else "C".__ne__
+        lines = [
+            f"{name} {x}"
+            for name, x, vtype in zip(self._varname, self._X, self._vtype)
+            if include(vtype)
+        ]
         with open(filename, "w") as file:
-            for name, x, vtype in zip(self._varname, self._X, self._vtype):
-                if include(vtype):
-                    print(f"{name} {x}", file=file)
+            if lines:
+                file.write("\n".join(lines) + "\n")
@@ -6,6 +6,8 @@ import gurobipy as gp
 import numpy as np
 import scipy.sparse as ss
 
+from bendee._kernels import csr_matvec_sub
+
 
 @dataclass
 class MasterData:
@@ -36,28 +38,38 @@ class SubproblemData:
 
     @property
     def zero_obj(self):
-        return all(self.c == 0)
+        # short-circuits in C, unlike the Python-level all(...)
+        return not np.any(self.c)
 
     def transform(self, translate_lb: bool, ub_constraints: bool) -> None:
         if translate_lb:
             self.offset = True
-            self.b -= self.B @ self.lb
+            # fused b -= B @ lb in one CSR pass
+            csr_matvec_sub(self.B, self.lb, self.b)
             self.c_const += self.c @ self.lb
             self.ub -= self.lb
 
         if ub_constraints:
-            idx_finite_ubs = np.nonzero(self.ub != float("inf"))[0]
+            idx_finite_ubs = np.flatnonzero(np.isfinite(self.ub))
+            # one -1 entry per row: build the CSR arrays directly
             B_ub = ss.csr_array(
                 (
-                    [-1] * len(idx_finite_ubs),  # data
-                    (range(len(idx_finite_ubs)), idx_finite_ubs),  # (row ind, col ind)
+                    np.full(idx_finite_ubs.size, -1.0),  # data
+                    idx_finite_ubs,  # indices
+                    np.arange(idx_finite_ubs.size + 1),  # indptr
                 ),
-                shape=(len(idx_finite_ubs), self.B.shape[1]),
+                shape=(idx_finite_ubs.size, self.B.shape[1]),
             )
-            self.B = ss.vstack([self.B, B_ub])
+            self.B = ss.vstack([self.B, B_ub], format="csr")
             self.b = np.concatenate([self.b, -self.ub[idx_finite_ubs]])
-            self.A = ss.vstack(
-                [self.A, ss.csr_array((len(idx_finite_ubs), self.A.shape[1]))]
+            # pad A with all-zero rows by extending indptr; data and
+            # indices are shared with the original matrix, so no copy
+            padded_indptr = np.concatenate(
+                [self.A.indptr, np.full(idx_finite_ubs.size, self.A.indptr[-1])]
+            )
+            self.A = ss.csr_matrix(
+                (self.A.data, self.A.indices, padded_indptr),
+                shape=(self.A.shape[0] + idx_finite_ubs.size, self.A.shape[1]),
             )
 
 
@@ -76,7 +88,8 @@ class ProblemSpec:
         self._model: gp.Model = model
         self._complicating_vars: List[int] = []
         self.non_complicating_vars: List[List[int]] = []
-        self.is_continuous_model = all(v.VType == "C" for v in model.getVars())
+        # one batched attribute fetch instead of a Gurobi call per variable
+        self.is_continuous_model = all(v == "C" for v in model.VType)
 
     def _assert_not_finalized(self):
         if self._finalized:
@@ -97,6 +110,18 @@ class ProblemSpec:
         logging.debug("adding_missing_indices")
         self._check_non_complicating_vars()
         logging.debug("_check_non_complicating_vars")
+        # cache the full model data once; every call below crosses the
+        # Gurobi C boundary and materializes a fresh copy
+        self._A_csr = self._model.getA().tocsr()
+        self._obj = np.array(self._model.obj)
+        self._rhs = np.array(self._model.RHS)
+        # single bytes per sense so the comparisons below are SIMD byte
+        # compares rather than per-element string compares
+        self._sense = np.frombuffer(
+            "".join(self._model.Sense).encode("ascii"), dtype="S1"
+        )
+        self._lb = np.array(self._model.lb)
+        self._ub = np.array(self._model.ub)
         self._make_constraint_sets()
         logging.debug("_make_constraint_sets")
         self._check_independent_subproblems()
@@ -126,34 +151,40 @@ class ProblemSpec:
             raise ValueError
 
     def _make_constraint_sets(self):
-        A = self._model.getA().tocsc()  # .indices will give us rows
-        self.master_constraint_inds = list(set(A[:, self.complicating_vars].indices))
+        A = self._A_csr.tocsc()  # .indices will give us rows
+        self.master_constraint_inds = np.unique(A[:, self.complicating_vars].indices)
         self.subproblem_constraint_inds = [
-            set(A[:, vars_list].indices) for vars_list in self.non_complicating_vars
+            np.unique(A[:, vars_list].indices)
+            for vars_list in self.non_complicating_vars
         ]
 
     def _check_independent_subproblems(self):
+        # a single sorted pass over all constraint indices replaces the
+        # pairwise Python-set disjointness checks
         if len(self.non_complicating_vars) <= 1:
-            return True
-        for j in range(1, len(self.subproblem_constraint_inds)):
-            for i in range(j):
-                if not self.subproblem_constraint_inds[i].isdisjoint(
-                    self.subproblem_constraint_inds[j]
-                ):
-                    raise RuntimeError(
-                        f"subproblems {i} and {j} have overlapping constraints"
-                    )
+            return
+        arrays = self.subproblem_constraint_inds
+        idx = np.concatenate(arrays)
+        sid = np.repeat(np.arange(len(arrays)), [a.size for a in arrays])
+        order = np.argsort(idx, kind="stable")
+        idx = idx[order]
+        sid = sid[order]
+        overlap = (idx[1:] == idx[:-1]) & (sid[1:] != sid[:-1])
+        if overlap.any():
+            pos = int(np.argmax(overlap))
+            i, j = sorted((int(sid[pos]), int(sid[pos + 1])))
+            raise RuntimeError(f"subproblems {i} and {j} have overlapping constraints")
 
     @property
     def _subproblem_variable_indices(self) -> List[int]:
         return [i for vars_list in self.non_complicating_vars for i in vars_list]
 
     @property
-    def _subproblem_constraint_indices(self) -> List[int]:
-        constraint_indices = set()
-        for s in self.subproblem_constraint_inds:
-            constraint_indices.update(s)
-        return list(constraint_indices)
+    def _subproblem_constraint_indices(self) -> np.ndarray:
+        if not self.subproblem_constraint_inds:
+            return np.array([], dtype=int)
+        # subproblems are constraint-disjoint, so concatenation suffices
+        return np.concatenate(self.subproblem_constraint_inds)
 
     def _make_master_model(self) -> gp.Model:
         # does not include theta
@@ -174,25 +205,30 @@ class ProblemSpec:
     def _make_subproblem_data(self, subproblem_num: int) -> SubproblemData:
         logging.debug("making subproblem data")
         var_indices: List = self.non_complicating_vars[subproblem_num]
-        constr_indices: List = list(self.subproblem_constraint_inds[subproblem_num])
-        c = np.array(self._model.obj)[var_indices]
+        constr_indices: np.ndarray = self.subproblem_constraint_inds[subproblem_num]
+        c = self._obj[var_indices]
 
         if self._model.ModelSense == gp.GRB.MAXIMIZE:
             c = -c
 
-        b = np.array(self._model.RHS)[constr_indices]
-        sense = np.array(self._model.Sense)[constr_indices]
-        A = self._model.getA()[constr_indices][:, self.complicating_vars]
-        B = self._model.getA()[constr_indices][:, var_indices]
-
-        le_inds = np.reshape(np.where(sense == "<", -1, 1), (-1, 1))
-        b = b * le_inds.flatten()
-        A = A.multiply(le_inds).tocsr()
-        B = B.multiply(le_inds).tocsr()
-        eq_inds = (sense == "=").nonzero()[0]
-
-        A = ss.vstack((A, -A[eq_inds, :]))
-        B = ss.vstack((B, -B[eq_inds, :]))
+        b = self._rhs[constr_indices]
+        sense = self._sense[constr_indices]
+        rows = self._A_csr[constr_indices]
+        A = rows[:, self.complicating_vars]
+        B = rows[:, var_indices]
+
+        le_inds = np.where(sense == b"<", -1.0, 1.0)
+        b = b * le_inds
+        # A and B are fresh CSR column slices; scaling their data in place
+        # flips the <= rows without the COO detour of .multiply()
+        A.data *= np.repeat(le_inds, np.diff(A.indptr))
+        B.data *= np.repeat(le_inds, np.diff(B.indptr))
+        eq_inds = (sense == b"=").nonzero()[0]
+
+        # request CSR directly; the default COO result would be converted
+        # row-by-row later anyway
+        A = ss.vstack((A, -A[eq_inds, :]), format="csr")
+        B = ss.vstack((B, -B[eq_inds, :]), format="csr")
         b = np.concatenate((b, -b[eq_inds]))
         logging.debug("made subproblem data")
         return SubproblemData(
@@ -201,7 +237,7 @@ class ProblemSpec:
             b=b,
             c=c,
             c_const=0,
-            lb=np.array(self._model.lb)[var_indices],
-            ub=np.array(self._model.ub)[var_indices],
+            lb=self._lb[var_indices],
+            ub=self._ub[var_indices],
             subproblem_num=subproblem_num,
         )
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Tuple
 
 import numpy as np
 
@@ -17,6 +17,10 @@ class CutRHS:
     coeffs: np.ndarray
 
 
+# (infeasible, cutRHS, subproblem_num)
+CutTuple = Tuple[bool, CutRHS, int]
+
+
 @dataclass
 class SubproblemResult:
     infeasible: bool
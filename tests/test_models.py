@@ -67,6 +67,39 @@ def test_model(model_filename, framework, lpform, subreturn):
         assert abs(grb_objval - m.ObjVal) < 0.001
 
 
+@pytest.mark.parametrize(
+    "model_filename",
+    ["knapsack_lin_bounds.mps.bz2", "knapsack_lin_decomposable.mps.bz2"],
+)
+@pytest.mark.parametrize("lpform", ["primal", "dual"])
+@pytest.mark.parametrize(
+    "solve_options",
+    [
+        {"in_out_alpha": 0.5},
+        {"pareto_cuts": True},
+        {"parallel_subproblems": True},
+        {"parallel_subproblems": False},
+    ],
+)
+def test_iterative_solve_options(model_filename, lpform, solve_options):
+    from bendee import Config, ProblemSpec, config, solve
+
+    with gp.Env() as env:
+        grb_objval = get_gurobi_objval(model_filename, env=env)
+        m = get_model(model_filename, env)
+        ps = ProblemSpec(m)
+        ps.set_complicating_vars([v for v in m.getVars() if v.VType != "C"])
+
+        config_ = Config()
+        config_.framework = config.Framework.iterative
+        config_.lp_form = config.SubproblemLpForm[lpform]
+        config_.sub_return = config.SubproblemReturn.duals
+        for key, value in solve_options.items():
+            setattr(config_, key, value)
+        result = solve(ps, config_, env)
+        assert abs(grb_objval - result.ObjVal) < 0.001
+
+
 def test_callback_framework_continuous_model():
     from bendee import Config, ProblemSpec, config, solve
 
@@ -80,7 +113,7 @@ def test_callback_framework_continuous_model():
         ps.set_complicating_vars([v for v in m.getVars() if v.index in inds])
 
         config_ = Config()
-        config_.sub_form = config.SubproblemLpForm.primal
+        config_.lp_form = config.SubproblemLpForm.primal
         config_.sub_return = config.SubproblemReturn.duals
         config_.framework = config.Framework.callback
         Result = solve(ps, config_, env)